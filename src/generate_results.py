@@ -9,39 +9,69 @@ CSV_FILE = 'test_suite_results.csv'
 OUTPUT_DIR = 'risultati_analisi'
 # file per le tabelle latex
 LATEX_TABLES_FILE = 'report_tabelle.tex'
+# tipi delle colonne del file CSV, dichiarati per evitare che pandas debba dedurli leggendo i dati
+# ('N/A' indica un campo non applicabile e viene letto come valore mancante).
+# Le colonne testuali hanno pochi valori distinti e sono categoriche: raggruppamenti e pivot
+# lavorano sui codici interi delle categorie invece di confrontare stringhe.
+CSV_DTYPES = {
+    'TestScenario': 'category',
+    'Algorithm': 'category',
+    'TestCase': 'category',
+    'StringLength': 'float64',
+    'Status': 'category',
+    'MedianTime_s': 'float64',
+    'PeakMemory_MB': 'float64',
+    'Alphabet': 'category',
+}
 
 plt.style.use('seaborn-v0_8-whitegrid')
 
 COLOR_PALETTE = ['#0072B2', '#D55E00', '#009E73', '#CC79A7']
 MARKER_STYLES = ['o', 's', '^', 'D']
 
+# tabella di traduzione e regex per ripulire i nomi dei file, preparate una sola volta:
+# gli spazi diventano '_', le parentesi vengono rimosse, poi si scartano gli altri caratteri non validi
+_SANITIZE_TABLE = str.maketrans({' ': '_', '(': None, ')': None})
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+
 # funzione per ripulire un nome di un file da caratteri non validi
 def sanitize_filename(name: str) -> str:
-    name = name.replace(' ', '_').replace('(', '').replace(')', '')
-    return re.sub(r'[^a-zA-Z0-9_]', '', name).lower()
+    return _SANITIZE_RE.sub('', name.translate(_SANITIZE_TABLE)).lower()
+
+# funzione che restituisce la tabella pivot di uno scenario, calcolandola solo la prima volta:
+# pivot_cache è creato da main per ogni analisi e indicizzato per (scenario, indice, colonne, valori),
+# perché la stessa tabella serve sia per il grafico che per la tabella latex
+def get_pivot(pivot_cache: dict, df: pd.DataFrame, scenario_id: str, index_col: str, columns_col: str,
+              values_col: str) -> pd.DataFrame:
+    key = (scenario_id, index_col, columns_col, values_col)
+    if key not in pivot_cache:
+        pivot_cache[key] = df.pivot_table(index=index_col, columns=columns_col, values=values_col, observed=True)
+    return pivot_cache[key]
 
 # funzione che genera il codice latex per una tabella pivot e lo scrive sul file
-def generate_latex_table(df: pd.DataFrame, caption: str, label: str, values_col: str, latex_file_handle,
+def generate_latex_table(df: pd.DataFrame, pivot_cache: dict, scenario_id: str, caption: str, label: str,
+                         values_col: str,
+                         latex_file_handle,
                          index_col: str = 'StringLength',
                          columns_col: str = 'Algorithm'):
     print(f"Generazione tabella LaTeX per: {caption}...")
     try:
-        # crea una tabella pivot per riorganizzare i dati
-        pivot_df = df.pivot_table(index=index_col, columns=columns_col, values=values_col)
+        # recupera la tabella pivot per riorganizzare i dati
+        pivot_df = get_pivot(pivot_cache, df, scenario_id, index_col, columns_col, values_col)
 
-        pivot_df.columns.name = None    # rimuove il nome all'asse delle colonne
+        # rimuove il nome all'asse delle colonne (senza modificare la tabella in cache)
+        pivot_df = pivot_df.rename_axis(columns=None)
         if pd.api.types.is_numeric_dtype(pivot_df.index):
-            pivot_df.index = pivot_df.index.astype(int)
-
-        # formatta i valori numerici
-        formatted_pivot = pivot_df.map(lambda x: f'{x:.6f}' if isinstance(x, float) else x)
+            pivot_df = pivot_df.set_axis(pivot_df.index.astype(int), axis=0)
 
         #formatta le colonne
-        column_format = 'l|' + '|'.join(['r'] * len(formatted_pivot.columns))
+        column_format = 'l|' + '|'.join(['r'] * len(pivot_df.columns))
 
         #ottiene una stringa di codice latex a partire dal dataframe
-        latex_code = formatted_pivot.to_latex(
+        # (i valori numerici vengono formattati direttamente da pandas con 6 cifre decimali)
+        latex_code = pivot_df.to_latex(
             caption=caption,
+            float_format='%.6f',
             label=f'tab:{sanitize_filename(label)}',
             column_format=column_format,
             header=True,
@@ -62,9 +92,10 @@ def generate_latex_table(df: pd.DataFrame, caption: str, label: str, values_col:
 def generate_correctness_latex(df: pd.DataFrame, caption: str, label: str, latex_file_handle):
     print(f"Generazione tabella LaTeX per: {caption}...")
     try:
-        # seleziona e riorganizza i dati per la tabella di correttezza
-        display_df = df[['TestCase', 'Algorithm', 'Status']].copy()
-        pivot_df = display_df.pivot(index='TestCase', columns='Algorithm', values='Status')
+        # riorganizza i dati per la tabella di correttezza (un solo esito per caso e algoritmo),
+        # considerando solo le categorie effettivamente presenti
+        pivot_df = df.pivot_table(index='TestCase', columns='Algorithm', values='Status', aggfunc='first',
+                                  observed=True)
         pivot_df.columns.name = None
 
         column_format = 'l|' + '|'.join(['c'] * len(pivot_df.columns))
@@ -87,19 +118,19 @@ def generate_correctness_latex(df: pd.DataFrame, caption: str, label: str, latex
 
 
 # funzione che crea e salva un grafico a linee per confrontare le performance degli algoritmi
-def plot_performance(df: pd.DataFrame, title: str, y_label: str, filename: str, use_log_scale: bool = False):
+# (disegna sugli assi ricevuti, che vengono ripuliti e riutilizzati per tutti i grafici a linee)
+def plot_performance(ax: plt.Axes, df: pd.DataFrame, pivot_cache: dict, scenario_id: str, title: str, y_label: str,
+                     filename: str, use_log_scale: bool = False):
     print(f"Generazione grafico: {title}...")
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    # itera su ogni algoritmo per disegnare la curva di performance
-    algorithms = sorted(df['Algorithm'].unique())
-    for i, algo_name in enumerate(algorithms):
-        group = df[df['Algorithm'] == algo_name]
-        ax.plot(group['StringLength'], group[y_label],
-                marker=MARKER_STYLES[i % len(MARKER_STYLES)],
-                linestyle='-',
-                label=algo_name,
-                color=COLOR_PALETTE[i % len(COLOR_PALETTE)])
+    ax.cla()
+
+    # disegna tutte le curve di performance con una sola chiamata, a partire dalla tabella pivot
+    # (una colonna per algoritmo, in ordine alfabetico), la stessa usata per la tabella latex
+    pivot_df = get_pivot(pivot_cache, df, scenario_id, 'StringLength', 'Algorithm', y_label)
+    num_algorithms = pivot_df.shape[1]
+    pivot_df.plot(ax=ax,
+                  style=[f'-{MARKER_STYLES[i % len(MARKER_STYLES)]}' for i in range(num_algorithms)],
+                  color=[COLOR_PALETTE[i % len(COLOR_PALETTE)] for i in range(num_algorithms)])
 
     # applica la scala logaritmica se richiesto (non l'ho usato alla fine)
     final_title = title
@@ -117,18 +148,19 @@ def plot_performance(df: pd.DataFrame, title: str, y_label: str, filename: str,
 
     # salva il grafico nella cartella
     output_path = os.path.join(OUTPUT_DIR, filename)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    ax.figure.savefig(output_path, dpi=300, bbox_inches='tight')
     print(f"Grafico salvato in: {output_path}")
 
 
 # funzione che crea e salva un grafico a barre per visualizzare l'impatto della dimensione dell'alfabeto
-def plot_alphabet_impact_single_algo(df: pd.DataFrame, algorithm_name: str, y_label: str, filename: str):
+# (come sopra, gli assi ricevuti vengono riutilizzati per tutti i grafici a barre)
+def plot_alphabet_impact_single_algo(ax: plt.Axes, df: pd.DataFrame, pivot_cache: dict, scenario_id: str,
+                                     algorithm_name: str, y_label: str, filename: str):
     metric_name = "Tempo" if "Time" in y_label else "Memoria"
     title = f"Impatto Alfabeto su {metric_name} ({algorithm_name})"
     print(f"Generazione grafico: {title}...")
-    pivot_df = df.pivot_table(index='StringLength', columns='Alphabet', values=y_label)
-    fig, ax = plt.subplots(figsize=(10, 7))
+    pivot_df = get_pivot(pivot_cache, df, scenario_id, 'StringLength', 'Alphabet', y_label)
+    ax.cla()
     pivot_df.plot(kind='bar', ax=ax, width=0.6, color=COLOR_PALETTE)
     ax.set_title(title, fontsize=16, pad=20)
     ax.set_xlabel('Lunghezza Stringa', fontsize=12)
@@ -136,10 +168,9 @@ def plot_alphabet_impact_single_algo(df: pd.DataFrame, algorithm_name: str, y_la
     ax.tick_params(axis='x', rotation=0)
     ax.legend(title='Alfabeto', fontsize=10)
     ax.grid(axis='y', linestyle='--')
-    plt.tight_layout()
+    ax.figure.tight_layout()
     output_path = os.path.join(OUTPUT_DIR, filename)
-    plt.savefig(output_path, dpi=300)
-    plt.close(fig)
+    ax.figure.savefig(output_path, dpi=300)
     print(f"Grafico salvato in: {output_path}")
 
 
@@ -152,10 +183,24 @@ def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     # carica tutti i risultati del file csv in un dataframe di pandas
-    df = pd.read_csv(CSV_FILE)
+    # e lo ordina una sola volta per algoritmo e lunghezza
+    df = pd.read_csv(CSV_FILE, dtype=CSV_DTYPES, na_values=['N/A'])
+    df = df.sort_values(['Algorithm', 'StringLength'], kind='stable')
+
+    # divide i risultati per scenario con un solo raggruppamento (gli scenari mancanti restano vuoti)
+    scenarios = dict(list(df.groupby('TestScenario', sort=False, observed=True)))
+    no_results = df.iloc[0:0]
 
     latex_output_path = os.path.join(OUTPUT_DIR, LATEX_TABLES_FILE)
 
+    # tabelle pivot già calcolate in questa analisi (vedi get_pivot)
+    pivot_cache = {}
+
+    # una sola figura per i grafici a linee e una per quelli a barre, riutilizzate per tutti i grafici
+    # invece di crearne una nuova ogni volta
+    line_fig, line_ax = plt.subplots(figsize=(12, 8))
+    bar_fig, bar_ax = plt.subplots(figsize=(10, 7))
+
     #scrivo preambolo e postambolo per il documento latex
     latex_preamble = r"""
 \documentclass[a4paper, 11pt]{article}
@@ -187,64 +232,77 @@ def main():
 
         # sezione dei test di correttezza chiamando la funzione apposita
         latex_file.write("\n\\section{Test di Correttezza}\n")
-        correctness_df = df[df['TestScenario'] == 'Correttezza'].copy()
+        correctness_df = scenarios.get('Correttezza', no_results)
         if not correctness_df.empty:
             generate_correctness_latex(correctness_df, 'Risultati dei test di correttezza', 'correttezza_risultati',
                                        latex_file)
 
         # sezione dei test di performance, dividendo fra esponenziali e polinomiali
         latex_file.write("\n\\section{Test di Performance - Confronto}\n")
-        exp_df = df[df['TestScenario'] == 'Performance Confronto - Esponenziale'].copy()
-        poly_df = df[df['TestScenario'] == 'Performance Confronto - Polinomiale'].copy()
+        exp_scenario = 'Performance Confronto - Esponenziale'
+        poly_scenario = 'Performance Confronto - Polinomiale'
+        exp_df = scenarios.get(exp_scenario, no_results)
+        poly_df = scenarios.get(poly_scenario, no_results)
 
         if not exp_df.empty:
             # genera i grafici e le tabelle per gli esponenziali
             latex_file.write("\n\\subsection{Algoritmi Esponenziali}\n")
-            plot_performance(exp_df, 'Confronto Performance (Tempo) - Algoritmi Esponenziali', 'MedianTime_s',
+            plot_performance(line_ax, exp_df, pivot_cache, exp_scenario,
+                             'Confronto Performance (Tempo) - Algoritmi Esponenziali', 'MedianTime_s',
                              'plot_confronto_tempo_esponenziale_lineare.png', use_log_scale=False)
-            plot_performance(exp_df, 'Confronto Performance (Memoria) - Algoritmi Esponenziali', 'PeakMemory_MB',
+            plot_performance(line_ax, exp_df, pivot_cache, exp_scenario,
+                             'Confronto Performance (Memoria) - Algoritmi Esponenziali', 'PeakMemory_MB',
                              'plot_confronto_memoria_esponenziale.png', use_log_scale=False)
-            generate_latex_table(exp_df, 'Tempi mediani (s) per confronto algoritmi esponenziali',
+            generate_latex_table(exp_df, pivot_cache, exp_scenario,
+                                 'Tempi mediani (s) per confronto algoritmi esponenziali',
                                  'confronto_tempi_esponenziali', 'MedianTime_s', latex_file)
-            generate_latex_table(exp_df, 'Picco di memoria (MB) per confronto algoritmi esponenziali',
+            generate_latex_table(exp_df, pivot_cache, exp_scenario,
+                                 'Picco di memoria (MB) per confronto algoritmi esponenziali',
                                  'confronto_memoria_esponenziale', 'PeakMemory_MB', latex_file)
 
         if not poly_df.empty:
             # genera i grafici e le tabelle per i polinomiali
             latex_file.write("\n\\subsection{Algoritmi Polinomiali}\n")
-            plot_performance(poly_df, 'Confronto Performance (Tempo) - Algoritmi Polinomiali', 'MedianTime_s',
+            plot_performance(line_ax, poly_df, pivot_cache, poly_scenario,
+                             'Confronto Performance (Tempo) - Algoritmi Polinomiali', 'MedianTime_s',
                              'plot_confronto_tempo_polinomiale.png')
-            plot_performance(poly_df, 'Confronto Performance (Memoria) - Algoritmi Polinomiali', 'PeakMemory_MB',
+            plot_performance(line_ax, poly_df, pivot_cache, poly_scenario,
+                             'Confronto Performance (Memoria) - Algoritmi Polinomiali', 'PeakMemory_MB',
                              'plot_confronto_memoria_polinomiale.png')
-            generate_latex_table(poly_df, 'Tempi mediani (s) per confronto algoritmi polinomiali',
+            generate_latex_table(poly_df, pivot_cache, poly_scenario,
+                                 'Tempi mediani (s) per confronto algoritmi polinomiali',
                                  'confronto_tempi_polinomiali', 'MedianTime_s', latex_file)
-            generate_latex_table(poly_df, 'Picco di memoria (MB) per confronto algoritmi polinomiali',
+            generate_latex_table(poly_df, pivot_cache, poly_scenario,
+                                 'Picco di memoria (MB) per confronto algoritmi polinomiali',
                                  'confronto_memoria_polinomiali', 'PeakMemory_MB', latex_file)
 
         # sezione sull'impatto dell'alfabeto
         latex_file.write("\n\\section{Test sull'Impatto dell'Alfabeto}\n")
-        alphabet_df = df[df['TestScenario'] == 'Impatto Alfabeto'].copy()
+        alphabet_df = scenarios.get('Impatto Alfabeto', no_results)
         if not alphabet_df.empty:
             # itera su ogni algoritmo e genera grafici e tabelle
-            for algo_name in sorted(alphabet_df['Algorithm'].unique()):
+            for algo_name, group in alphabet_df.groupby('Algorithm', sort=True, observed=True):
                 latex_file.write(f"\n\\subsection{{{algo_name}}}\n")
-                group = alphabet_df[alphabet_df['Algorithm'] == algo_name]
                 sanitized_name = sanitize_filename(algo_name)
+                scenario_id = f'Impatto Alfabeto - {algo_name}'
 
-                plot_alphabet_impact_single_algo(group, algo_name, 'MedianTime_s',
+                plot_alphabet_impact_single_algo(bar_ax, group, pivot_cache, scenario_id, algo_name, 'MedianTime_s',
                                                  f'plot_impatto_alfabeto_tempo_{sanitized_name}.png')
-                plot_alphabet_impact_single_algo(group, algo_name, 'PeakMemory_MB',
+                plot_alphabet_impact_single_algo(bar_ax, group, pivot_cache, scenario_id, algo_name, 'PeakMemory_MB',
                                                  f'plot_impatto_alfabeto_memoria_{sanitized_name}.png')
 
-                generate_latex_table(group, f'Impatto Alfabeto ({algo_name}) - Tempo (s)',
+                generate_latex_table(group, pivot_cache, scenario_id, f'Impatto Alfabeto ({algo_name}) - Tempo (s)',
                                      f'impatto_alfabeto_tempo_{sanitize_filename(algo_name)}', 'MedianTime_s',
                                      latex_file, columns_col='Alphabet')
-                generate_latex_table(group, f'Impatto Alfabeto ({algo_name}) - Memoria (MB)',
+                generate_latex_table(group, pivot_cache, scenario_id, f'Impatto Alfabeto ({algo_name}) - Memoria (MB)',
                                      f'impatto_alfabeto_memoria_{sanitize_filename(algo_name)}', 'PeakMemory_MB',
                                      latex_file, columns_col='Alphabet')
 
         latex_file.write(latex_postamble)
 
+    plt.close(line_fig)
+    plt.close(bar_fig)
+
     print(f"\nAnalisi completata. Tutti i grafici sono stati salvati nella cartella: '{os.path.abspath(OUTPUT_DIR)}'")
 
 
@@ -1,52 +1,79 @@
 """
-Questo file contiene le implementazioni di quattro diversi algoritmi per risolvere
+Questo file contiene le implementazioni di sei diversi algoritmi per risolvere
 il problema della Longest Common Subsequence (LCS).
 Gli approcci implementati sono:
 1. Forza Bruta
 2. Ricorsivo Semplice
 3. Ricorsivo con Memoization (Top-Down)
 4. Bottom-Up (Programmazione Dinamica)
+5. Hirschberg (Programmazione Dinamica in spazio lineare)
+6. Bit-parallel (Programmazione Dinamica su maschere di bit, algoritmo di Hyyrö)
 """
 
+import sys
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+
 
 def lcs_brute_force(X: str, Y: str) -> str:
     """
     La versione forza bruta calcola tutte le sottosequenze di una stringa (X)
     e, per ciascuna, verifica se è anche una sottosequenza dell'altra stringa (Y).
     Mantiene traccia della più lunga trovata.
+    Le maschere sono visitate in ordine di codice Gray, così due maschere consecutive differiscono
+    per un solo bit e la verifica riparte solo dal carattere cambiato invece che da capo.
     """
     m = len(X)
-    longest_common_subsequence = ""
-
-    # Itera su tutte le 2^m sottosequenze di X (bit mask).
-    for i in range(1 << m):
-        subsequence = ""
-        for j in range(m):
-            # Se il j-esimo bit di 'i' è 1, il carattere X[j] fa parte della sottosequenza.
-            if (i >> j) & 1:
-                subsequence += X[j]
+    best_mask, best_len = 0, 0
 
-        # Verifica se la sottosequenza generata è anche in Y e se è la più lunga trovata.
-        if _is_subsequence(subsequence, Y):
-            if len(subsequence) > len(longest_common_subsequence):
-                longest_common_subsequence = subsequence
+    # Per ogni carattere di Y, la lista ordinata delle posizioni in cui compare:
+    # costruita una volta sola, permette di cercare la prossima occorrenza con una ricerca binaria.
+    positions = {}
+    for k, y_char in enumerate(Y):
+        positions.setdefault(y_char, []).append(k)
+    no_positions = []
 
-    return longest_common_subsequence
+    # cursor[d] è la prima posizione di Y ancora utilizzabile dopo aver verificato i primi d
+    # caratteri di X secondo la maschera corrente (-1 se un carattere selezionato non è stato trovato).
+    # Solo cursor[0..valid] è coerente con la maschera corrente.
+    cursor = [0] * (m + 1)
+    valid = m
+    prev_gray = 0
 
+    # Itera su tutte le 2^m sottosequenze di X (bit mask), in ordine di codice Gray.
+    # Il bit (m - 1 - d) di 'gray' indica se X[d] fa parte della sottosequenza: i caratteri finali
+    # di X corrispondono ai bit che cambiano più spesso, quindi di solito si riverifica solo la coda.
+    for i in range(1, 1 << m):
+        gray = i ^ (i >> 1)
+        flipped = (gray ^ prev_gray).bit_length() - 1
+        prev_gray = gray
+        valid = min(valid, m - 1 - flipped)
 
-def _is_subsequence(sub: str, main_str: str) -> bool:
-    """
-    Verifica se 'sub' è una sottosequenza di 'main_str' usando due puntatori.
-    """
-    i, j = 0, 0  # Puntatori per 'sub' e 'main_str'
+        # Una sottosequenza non più lunga della migliore trovata non può migliorarla.
+        length = gray.bit_count()
+        if length <= best_len:
+            continue
 
-    while i < len(sub) and j < len(main_str):
-        if sub[i] == main_str[j]:
-            i += 1  # Carattere corrispondente trovato
-        j += 1  # Avanza sempre su main_str
+        # Riprende la verifica dal primo carattere non più coerente, saltando per ogni carattere
+        # selezionato alla sua prossima occorrenza in Y.
+        d = valid
+        k = cursor[d]
+        while d < m and k >= 0:
+            if (gray >> (m - 1 - d)) & 1:
+                char_positions = positions.get(X[d], no_positions)
+                idx = bisect_left(char_positions, k)
+                k = char_positions[idx] + 1 if idx < len(char_positions) else -1
+            d += 1
+            cursor[d] = k
+        valid = d
 
-    return i == len(sub)  # True se tutti i caratteri di 'sub' sono stati trovati
+        # Se la sottosequenza è anche in Y, è la più lunga trovata finora: ne salvo la maschera.
+        if k >= 0:
+            best_mask, best_len = gray, length
 
+    # La stringa viene ricostruita una sola volta, a partire dalla maschera migliore.
+    return "".join(X[d] for d in range(m) if (best_mask >> (m - 1 - d)) & 1)
 
 
 def lcs_recursive(X: str, Y: str) -> str:
@@ -54,21 +81,24 @@ def lcs_recursive(X: str, Y: str) -> str:
     Calcola la LCS usando l'approccio ricorsivo semplice.
     Confronta gli ultimi caratteri delle stringhe: se coincidono, li include nella soluzione e
     continua sui prefissi; altrimenti prova entrambe le possibilità e sceglie la più lunga.
+    I prefissi sono identificati dalle loro lunghezze (i, j), senza creare copie delle stringhe.
     """
-    m, n = len(X), len(Y)
 
-    # Caso base: una delle due stringhe è vuota.
-    if m == 0 or n == 0:
-        return ""
+    def _lcs_rec(i, j):
+        # Caso base: uno dei due prefissi è vuoto.
+        if i == 0 or j == 0:
+            return ""
+
+        # Se gli ultimi caratteri corrispondono, sono parte della LCS.
+        if X[i - 1] == Y[j - 1]:
+            return _lcs_rec(i - 1, j - 1) + X[i - 1]
+        # Altrimenti, la LCS è la più lunga tra quelle dei due possibili sottoproblemi.
+        else:
+            lcs1 = _lcs_rec(i, j - 1)
+            lcs2 = _lcs_rec(i - 1, j)
+            return lcs1 if len(lcs1) >= len(lcs2) else lcs2
 
-    # Se gli ultimi caratteri corrispondono, sono parte della LCS.
-    if X[m - 1] == Y[n - 1]:
-        return lcs_recursive(X[:-1], Y[:-1]) + X[m - 1]
-    # Altrimenti, la LCS è la più lunga tra quelle dei due possibili sottoproblemi.
-    else:
-        lcs1 = lcs_recursive(X, Y[:-1])
-        lcs2 = lcs_recursive(X[:-1], Y)
-        return lcs1 if len(lcs1) >= len(lcs2) else lcs2
+    return _lcs_rec(len(X), len(Y))
 
 
 def lcs_memoized(X: str, Y: str) -> str:
@@ -76,29 +106,48 @@ def lcs_memoized(X: str, Y: str) -> str:
     Calcola la LCS in modo ricorsivo top down.
     Evita calcoli ripetuti salvando i risultati intermedi in una cache. Prima di ricorrere a
     nuove chiamate, controlla se il risultato è già noto e, se necessario, lo salva per usi futuri.
+    In cache si salvano solo le lunghezze dei sottoproblemi: la stringa viene ricostruita alla fine
+    percorrendo le lunghezze già calcolate, come nel backtracking del bottom-up.
     """
-    memo = {}  # Cache per i risultati dei sottoproblemi (i, j)
 
-    def _lcs_memo(i, j):
-        # Se il risultato è già in cache, lo restituisco.
-        if (i, j) in memo:
-            return memo[(i, j)]
-
-        # Logica ricorsiva identica alla versione semplice.
+    # lru_cache fa da cache per i risultati dei sottoproblemi (i, j).
+    @lru_cache(maxsize=None)
+    def _lcs_length(i, j):
+        # Logica ricorsiva identica alla versione semplice, ma sulle lunghezze.
         if i == 0 or j == 0:
-            return ""
+            return 0
         if X[i - 1] == Y[j - 1]:
-            result = _lcs_memo(i - 1, j - 1) + X[i - 1]
-        else:
-            lcs1 = _lcs_memo(i, j - 1)
-            lcs2 = _lcs_memo(i - 1, j)
-            result = lcs1 if len(lcs1) >= len(lcs2) else lcs2
+            return _lcs_length(i - 1, j - 1) + 1
+        len1 = _lcs_length(i, j - 1)
+        len2 = _lcs_length(i - 1, j)
+        return len1 if len1 >= len2 else len2
 
-        # Salvo il risultato in cache prima di restituirlo.
-        memo[(i, j)] = result
-        return result
+    # La ricorsione arriva a profondità m + n e con lru_cache ogni livello occupa due frame
+    # (wrapper della cache + funzione): il limite di ricorsione viene alzato quanto basta
+    # e ripristinato alla fine.
+    m, n = len(X), len(Y)
+    old_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(old_limit, 2 * (m + n) + 100))
+    try:
+        _lcs_length(m, n)
+
+        # Ricostruzione della stringa LCS seguendo le scelte fatte dalla ricorsione,
+        # le cui lunghezze sono già tutte in cache.
+        lcs_chars = []
+        i, j = m, n
+        while i > 0 and j > 0:
+            if X[i - 1] == Y[j - 1]:
+                lcs_chars.append(X[i - 1])
+                i -= 1
+                j -= 1
+            elif _lcs_length(i, j - 1) >= _lcs_length(i - 1, j):
+                j -= 1
+            else:
+                i -= 1
+    finally:
+        sys.setrecursionlimit(old_limit)
 
-    return _lcs_memo(len(X), len(Y))
+    return "".join(reversed(lcs_chars))
 
 
 def lcs_bottom_up(X: str, Y: str) -> str:
@@ -110,14 +159,25 @@ def lcs_bottom_up(X: str, Y: str) -> str:
     m, n = len(X), len(Y)
 
     # Fase 1: Costruzione della tabella `c` delle lunghezze.
-    c = [[0] * (n + 1) for _ in range(m + 1)]
+    # La tabella è un unico buffer piatto di interi a 16 bit (2 byte per cella invece di un
+    # riferimento a un int Python per cella), dove la cella (i, j) si trova in c[i * stride + j].
+    stride = n + 1
+    c = array(_length_typecode(m, n), [0]) * ((m + 1) * stride)
 
     for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if X[i - 1] == Y[j - 1]:
-                c[i][j] = c[i - 1][j - 1] + 1
-            else:
-                c[i][j] = max(c[i - 1][j], c[i][j - 1])
+        x_char = X[i - 1]
+        prev, cur = (i - 1) * stride, i * stride  # inizio della riga precedente e di quella corrente
+        # `left` è il valore appena scritto in c[i][j - 1], `diag` quello di c[i - 1][j - 1]:
+        # tenerli in variabili locali riduce gli accessi al buffer a una lettura e una scrittura per cella.
+        left = diag = 0
+        for j, y_char in enumerate(Y, 1):
+            up = c[prev + j]
+            if x_char == y_char:
+                left = diag + 1
+            elif up > left:
+                left = up
+            c[cur + j] = left
+            diag = up
 
     # Fase 2: Ricostruzione della stringa LCS (backtracking).
     # Si parte dall'angolo in basso a destra della tabella e si risale.
@@ -130,9 +190,113 @@ def lcs_bottom_up(X: str, Y: str) -> str:
             i -= 1
             j -= 1
         # Altrimenti, ci si sposta nella direzione del valore più grande.
-        elif c[i - 1][j] > c[i][j - 1]:
+        elif c[(i - 1) * stride + j] > c[i * stride + j - 1]:
             i -= 1
         else:
             j -= 1
 
     return lcs_str
+
+
+def lcs_hirschberg(X: str, Y: str) -> str:
+    """
+    Calcola la LCS con l'algoritmo di Hirschberg (divide et impera).
+    Usa la stessa ricorrenza del bottom-up, ma tiene in memoria solo due righe della tabella:
+    divide X a metà, trova il punto k in cui spezzare Y combinando la riga calcolata in avanti sulla
+    prima metà e quella calcolata all'indietro sulla seconda, e risolve ricorsivamente le due parti.
+    La memoria scende da O(mn) a O(m + n), a parità di risultato.
+    """
+    m, n = len(X), len(Y)
+
+    # Casi base: stringa vuota oppure X di un solo carattere.
+    if m == 0 or n == 0:
+        return ""
+    if m == 1:
+        return X if X in Y else ""
+
+    mid = m // 2
+    # Ultima riga della tabella per (X[:mid], Y) e per le stringhe rovesciate (X[mid:], Y).
+    forward = _lcs_length_last_row(X[:mid], Y)
+    backward = _lcs_length_last_row(X[mid:][::-1], Y[::-1])
+
+    # Il punto di divisione ottimo di Y massimizza la somma delle due metà.
+    k = max(range(n + 1), key=lambda j: forward[j] + backward[n - j])
+
+    return lcs_hirschberg(X[:mid], Y[:k]) + lcs_hirschberg(X[mid:], Y[k:])
+
+
+def _lcs_length_last_row(X: str, Y: str) -> array:
+    """
+    Restituisce l'ultima riga della tabella delle lunghezze LCS tra X e Y,
+    calcolata scorrendo la tabella con due sole righe che si alternano.
+    """
+    n = len(Y)
+    typecode = _length_typecode(len(X), n)
+    prev = array(typecode, [0]) * (n + 1)
+    cur = array(typecode, [0]) * (n + 1)
+
+    for x_char in X:
+        left = diag = 0
+        for j, y_char in enumerate(Y, 1):
+            up = prev[j]
+            if x_char == y_char:
+                left = diag + 1
+            elif up > left:
+                left = up
+            cur[j] = left
+            diag = up
+        prev, cur = cur, prev  # la riga appena calcolata diventa la precedente
+
+    return prev
+
+
+def _length_typecode(m: int, n: int) -> str:
+    """
+    Sceglie il tipo degli interi per le tabelle delle lunghezze: 16 bit bastano finché
+    la LCS (al più min(m, n)) non supera 65535, altrimenti si passa a interi più larghi.
+    """
+    return 'H' if min(m, n) <= 0xFFFF else 'L'
+
+
+def lcs_bit_parallel(X: str, Y: str) -> str:
+    """
+    Calcola la LCS con l'algoritmo bit-parallel di Hyyrö.
+    Un'intera colonna della tabella (una cella per ogni carattere di X) è rappresentata da un
+    intero V, in cui ogni bit a 0 segna un incremento della lunghezza LCS: per ogni carattere di Y
+    la colonna successiva si ottiene con poche operazioni bit a bit, invece che cella per cella.
+    Le colonne vengono conservate per ricostruire la stringa come nel bottom-up.
+    """
+    m, n = len(X), len(Y)
+    all_ones = (1 << m) - 1
+
+    # match[c] ha il bit i acceso se e solo se X[i] == c.
+    match = {}
+    for i, x_char in enumerate(X):
+        match[x_char] = match.get(x_char, 0) | (1 << i)
+
+    # Fase 1: calcolo delle colonne. columns[j] è la colonna dopo i primi j caratteri di Y.
+    V = all_ones
+    columns = [V]
+    for y_char in Y:
+        U = V & match.get(y_char, 0)
+        V = ((V + U) | (V - U)) & all_ones
+        columns.append(V)
+
+    # La lunghezza LCS tra X[:i] e Y[:j] è il numero di bit a 0 tra gli i bit bassi della colonna j.
+    def _length(i, j):
+        return i - (columns[j] & ((1 << i) - 1)).bit_count()
+
+    # Fase 2: Ricostruzione della stringa LCS (backtracking), come nel bottom-up.
+    lcs_chars = []
+    i, j = m, n
+    while i > 0 and j > 0:
+        if X[i - 1] == Y[j - 1]:
+            lcs_chars.append(X[i - 1])
+            i -= 1
+            j -= 1
+        elif _length(i - 1, j) > _length(i, j - 1):
+            i -= 1
+        else:
+            j -= 1
+
+    return "".join(reversed(lcs_chars))
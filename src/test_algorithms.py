@@ -1,16 +1,25 @@
 import time
 import random
 import string
-import statistics
 import csv
 import os
+import gc
 import tracemalloc
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from itertools import product
 
 from lcs_algorithms import (
     lcs_memoized,
     lcs_bottom_up,
     lcs_recursive,
-    lcs_brute_force
+    lcs_brute_force,
+    lcs_hirschberg,
+    lcs_bit_parallel
 )
 
 # Dizionario algoritmi
@@ -19,15 +28,71 @@ ALGORITHMS = {
     "Ricorsivo": lcs_recursive,
     "Memoized": lcs_memoized,
     "Bottom-up": lcs_bottom_up,
+    "Hirschberg": lcs_hirschberg,
+    "Bit-parallel": lcs_bit_parallel,
+}
+
+
+@dataclass(slots=True)
+class Result:
+    """
+    Una riga del file dei risultati, con schema fisso: ogni campo indica nei metadati la colonna del CSV.
+    I campi lasciati a None non vengono scritti e nel file compaiono come 'N/A'.
+    """
+    scenario: str = field(metadata={"column": "TestScenario"})
+    algorithm: str = field(metadata={"column": "Algorithm"})
+    test_case: str | None = field(default=None, metadata={"column": "TestCase"})
+    length: int | None = field(default=None, metadata={"column": "StringLength"})
+    status: str | None = field(default=None, metadata={"column": "Status"})
+    median_time_s: float | None = field(default=None, metadata={"column": "MedianTime_s"})
+    peak_mem_mb: float | None = field(default=None, metadata={"column": "PeakMemory_MB"})
+    alphabet: str | None = field(default=None, metadata={"column": "Alphabet"})
+
+    def to_row(self) -> dict:
+        """Restituisce la riga come dizionario colonna -> valore, omettendo i campi non valorizzati"""
+        row = {}
+        for name, column in _RESULT_COLUMNS:
+            value = getattr(self, name)
+            if value is not None:
+                row[column] = value
+        return row
+
+
+# coppie (campo, colonna) di Result, calcolate una sola volta
+_RESULT_COLUMNS = [(f.name, f.metadata["column"]) for f in fields(Result)]
+
+# Colonne del file CSV dei risultati, nell'ordine in cui vengono scritte (quello dei campi di Result)
+CSV_FIELDNAMES = [column for _, column in _RESULT_COLUMNS]
+
+# Durata minima (in nanosecondi) di una misura di tempo, vedi _run_timed
+MIN_TIMED_NS = 10 ** 6
+
+# Tempo massimo (in secondi) stimato per una misura: oltre, la cella viene saltata (vedi _run_timed_within_budget)
+BUDGET_SECONDS = 30
+
+# Fattore stimato di crescita del tempo di ogni algoritmo da una lunghezza alla successiva: la forza bruta
+# raddoppia i sottoinsiemi da provare per ogni carattere in più, la ricorsione raddoppia per ogni carattere
+# in più di ciascuna delle due stringhe; per gli algoritmi O(m*n) 4 copre il raddoppio di entrambe le lunghezze
+BUDGET_GROWTH = {
+    "Forza Bruta": 2,
+    "Ricorsivo": 4,
+    "Memoized": 4,
+    "Bottom-up": 4,
+    "Hirschberg": 4,
+    "Bit-parallel": 4,
 }
 
 
 # --- FUNZIONI DI SUPPORTO ---
-def generate_random_string(length: int, alphabet: str) -> str:
-    """Genera una stringa casuale di data lunghezza da dato alfabeto"""
-    if length == 0:
-        return ""
-    return ''.join(random.choice(alphabet) for i in range(length))
+def generate_random_string(length: int, alphabet_bytes: bytes, rng: random.Random) -> str:
+    """
+    Genera una stringa casuale di data lunghezza dal dato alfabeto, usando il generatore rng.
+    L'alfabeto va passato già codificato in byte ASCII, così chi genera molte stringhe lo codifica una volta sola.
+    """
+    # una sola chiamata a choices estrae tutti i caratteri (per length == 0 restituisce una lista vuota);
+    # estraendo dai byte dell'alfabeto si ottengono interi piccoli (già preallocati da Python)
+    # invece di una stringa per carattere, e bytes() li converte tutti insieme
+    return bytes(rng.choices(alphabet_bytes, k=length)).decode('ascii')
 
 
 def run_single_experiment(algorithm_func, X: str, Y: str):
@@ -35,37 +100,208 @@ def run_single_experiment(algorithm_func, X: str, Y: str):
     Esegue un singolo esperimento per un dato algoritmo. Misura tempo e memoria.
     Restituisce una tupla contenente (result_lcs, execution_time_s, peak_memory_mb).
     """
-    # inizia il tracciamento della memoria
-    tracemalloc.start()
+    # due esecuzioni separate, così il tracciamento della memoria non rallenta quella cronometrata
+    result_lcs, execution_time_ns = _run_timed(algorithm_func, X, Y)
+    _, peak_memory_mb = _run_memory(algorithm_func, X, Y)
+    return result_lcs, execution_time_ns / 10 ** 9, peak_memory_mb
 
-    # misura il tempo di esecuzione dell'algoritmo
-    start_time = time.perf_counter()
-    result_lcs = algorithm_func(X, Y)
-    end_time = time.perf_counter()
 
-    # ottiene il picco di memoria utilizzato e ferma il tracciamento
-    _, peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    execution_time_s = end_time - start_time
+def _run_timed(algorithm_func, X: str, Y: str):
+    """
+    Misura solo il tempo di esecuzione dell'algoritmo, senza tracemalloc attivo.
+    Restituisce una tupla contenente (result_lcs, execution_time_ns), con il tempo medio per chiamata
+    in nanosecondi interi (va convertito in secondi solo al momento di scriverlo nei risultati).
+    """
+    # come nel modulo timeit, il garbage collector viene svuotato prima e disattivato durante
+    # la misura, così una raccolta non capita a caso dentro l'intervallo cronometrato
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # le chiamate più brevi di MIN_TIMED_NS vengono ripetute raddoppiandone il numero (come
+        # timeit.autorange) finché il tempo totale non la supera, così anche gli input minuscoli
+        # hanno una misura stabile
+        number = 1
+        while True:
+            start_ns = time.perf_counter_ns()
+            for _ in range(number):
+                result_lcs = algorithm_func(X, Y)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            if elapsed_ns >= MIN_TIMED_NS:
+                break
+            number *= 2
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return result_lcs, elapsed_ns // number
+
+
+@contextmanager
+def _memory_tracing():
+    """Attiva tracemalloc per la durata del blocco, se non è già attivo, e lo ferma all'uscita"""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def _run_memory(algorithm_func, X: str, Y: str):
+    """
+    Misura solo il picco di memoria dell'algoritmo tramite tracemalloc (il tempo di questa esecuzione viene ignorato).
+    Restituisce una tupla contenente (result_lcs, peak_memory_mb).
+    """
+    gc.collect()
+    # dentro il blocco _memory_tracing di una suite il tracciamento è già attivo e basta azzerarne
+    # il picco con reset_peak, molto più economico di un ciclo start/stop per ogni misura
+    with _memory_tracing():
+        # il picco viene riportato alla memoria attualmente tracciata, che si sottrae come base
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        result_lcs = algorithm_func(X, Y)
 
-    peak_memory_mb = peak_mem / 10 ** 6
-    return result_lcs, execution_time_s, peak_memory_mb     # converte da byte a megabyte
+        # ottiene il picco di memoria utilizzato durante la chiamata
+        _, peak_mem = tracemalloc.get_traced_memory()
+
+    peak_memory_mb = (peak_mem - baseline) / 10 ** 6     # converte da byte a megabyte
+    return result_lcs, peak_memory_mb
+
+
+def _experiment_strings(scenario: str, length: int, alphabet_bytes: bytes, rep_idx: int):
+    """
+    Genera la coppia di stringhe (X, Y) per un dato scenario, lunghezza e ripetizione, riproducibile
+    tra un'esecuzione e l'altra. L'alfabeto va passato già codificato in byte.
+    """
+    # generatore dedicato con un seme che dipende solo da (scenario, length, rep_idx); il seme è una
+    # stringa e non hash() di una tupla, che cambia a ogni avvio di Python
+    rng = random.Random(f"{scenario}:{length}:{rep_idx}")
+    return generate_random_string(length, alphabet_bytes, rng), generate_random_string(length, alphabet_bytes, rng)
+
+
+@lru_cache(maxsize=None)
+def _reference_lcs_length(X: str, Y: str) -> int:
+    """
+    Lunghezza della LCS di riferimento per una coppia di stringhe, calcolata qui con la programmazione
+    dinamica classica su due righe, indipendentemente dagli algoritmi misurati.
+    Tutti gli algoritmi vengono misurati sulle stesse coppie: la cache evita di ricalcolarla per ognuno di essi.
+    """
+    previous = [0] * (len(Y) + 1)
+    for x in X:
+        current = [0]
+        for j, y in enumerate(Y):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def _warm_up_algorithms():
+    """
+    Esegue una volta ogni algoritmo su stringhe minuscole, senza misurarlo, così eventuali inizializzazioni
+    pigre non finiscono dentro la prima misura (viene chiamata all'avvio e da ogni processo del pool).
+    """
+    for algorithm_func in ALGORITHMS.values():
+        algorithm_func("ABCB", "BDCA")
+
+
+def _one_timed_experiment(key, algo_name: str, X: str, Y: str):
+    """
+    Esegue in un processo separato la misura di tempo di un singolo esperimento.
+    Restituisce una tupla contenente (key, execution_time_ns, result_lcs), dove key identifica la cella
+    (es. algoritmo e lunghezza) a cui appartiene la misura.
+    """
+    result_lcs, exec_time_ns = _run_timed(ALGORITHMS[algo_name], X, Y)
+    return key, exec_time_ns, result_lcs
+
+
+def _run_timed_in_parallel(pool, tasks):
+    """
+    Misura sul pool di processi i tempi dei task (key, algo_name, X, Y) e restituisce due dizionari:
+    key -> tempi misurati (in ns) e key -> stato ("Pass" o "Fail") della validità delle LCS trovate.
+    """
+    # le misure vengono inviate ai processi a blocchi, così il costo di comunicazione non supera quello
+    # delle molte misure brevi
+    chunksize = max(1, len(tasks) // (4 * (os.cpu_count() or 1)))
+    # i tempi (interi) di ogni key in un array compatto invece che in una lista di oggetti int
+    times, statuses = defaultdict(lambda: array('q')), {}
+    # tutti i risultati vengono raccolti prima dei controlli: il calcolo della lunghezza di riferimento
+    # non deve sottrarre CPU ai processi che stanno ancora misurando
+    results = list(pool.map(_one_timed_experiment, *zip(*tasks), chunksize=chunksize))
+    # map restituisce i risultati nell'ordine dei task, quindi ogni risultato si abbina alla sua coppia
+    for (_, algo_name, X, Y), (key, exec_time_ns, result_lcs) in zip(tasks, results):
+        times[key].append(exec_time_ns)
+        # la LCS trovata deve avere la lunghezza di riferimento ed essere sottosequenza di entrambe le stringhe
+        is_correct = (len(result_lcs) == _reference_lcs_length(X, Y)
+                      and _is_subsequence(result_lcs, X) and _is_subsequence(result_lcs, Y))
+        if not is_correct and statuses.get(key) != "Fail":
+            print(f" - ATTENZIONE: {algo_name} ha restituito una LCS non valida (lunghezza {len(X)})")
+        statuses[key] = "Pass" if is_correct and statuses.get(key, "Pass") == "Pass" else "Fail"
+    return dict(times), statuses
+
+
+def _run_timed_within_budget(pool, lengths, cells):
+    """
+    Misura in parallelo i tempi di ogni serie di celle, una lunghezza alla volta, saltando le celle il cui
+    tempo stimato supera BUDGET_SECONDS. cells associa a ogni lunghezza un dizionario serie -> coppie di
+    stringhe, dove una serie è una tupla che inizia con il nome dell'algoritmo.
+    Restituisce i dizionari (times, statuses) di _run_timed_in_parallel, indicizzati per (*serie, lunghezza):
+    le celle saltate non vi compaiono.
+    """
+    times, statuses = {}, {}
+    # mediana (in secondi) dell'ultima lunghezza misurata per ogni serie
+    last_median_s = {}
+    for length in lengths:
+        tasks = []
+        for series, series_pairs in cells[length].items():
+            algo_name = series[0]
+            # il tempo della nuova lunghezza viene stimato dalla mediana della precedente
+            if last_median_s.get(series, 0.0) * BUDGET_GROWTH[algo_name] > BUDGET_SECONDS:
+                print(f" - {' / '.join(series)} con lunghezza {length} saltato: tempo stimato oltre "
+                      f"{BUDGET_SECONDS} s")
+                continue
+            tasks += [((*series, length), algo_name, X, Y) for X, Y in series_pairs]
+        if not tasks:
+            continue
+        print(f" - Misura dei tempi di {len(tasks)} esperimenti in parallelo (lunghezza {length})")
+        length_times, length_statuses = _run_timed_in_parallel(pool, tasks)
+        times.update(length_times)
+        statuses.update(length_statuses)
+        for key, cell_times in length_times.items():
+            last_median_s[key[:-1]] = _median(cell_times) / 10 ** 9
+    return times, statuses
+
+
+def _median(values) -> float:
+    """
+    Calcola la mediana di una sequenza corta di misure (num_repetitions elementi).
+    Equivale a statistics.median per valori numerici, senza i suoi controlli e conversioni di tipo.
+    """
+    s = sorted(values)
+    n = len(s)
+    mid = n // 2
+    return s[mid] if n & 1 else (s[mid - 1] + s[mid]) / 2
 
 
 def _is_subsequence(sub: str, main_str: str) -> bool:
     """
     Funzione di supporto per verificare se 'sub' è una sottosequenza di 'main_str'.
     """
-    i = 0
-    j = 0
-
-    while i < len(sub) and j < len(main_str):
-        if sub[i] == main_str[j]:
-            i += 1  # se i caratteri corrispondono, aumento l'indice di sub
-        j += 1      # in ogni caso aumento quello di main_str
+    # una stringa più lunga di main_str non può esserne sottosequenza
+    if len(sub) > len(main_str):
+        return False
 
-    # se ho trovato tutti i caratteri di sub, l'indice i deve essere pari alla sua lunghezza
-    return i == len(sub)
+    # 'pos' è la prima posizione di main_str ancora utilizzabile: per ogni carattere di sub,
+    # str.find cerca la sua prossima occorrenza direttamente in C invece di avanzare un carattere
+    # alla volta in Python
+    pos = 0
+    for char in sub:
+        pos = main_str.find(char, pos)
+        if pos < 0:
+            return False    # carattere non trovato nella parte rimanente di main_str
+        pos += 1
+    return True
 
 
 # --- SUITE DI TEST ---
@@ -75,7 +311,6 @@ def run_correctness_tests():
     Esegue test di correttezza per verificare che tutti gli algoritmi producano una LCS valida.
     """
     print("--- Inizio Test di Correttezza ---")
-    results = []
     # lista di casi di test, ciascuno definito con un dizionario
     test_cases = [
         {"X": "AGGTAB", "Y": "GXTXAYB", "expected": "GTAB", "case": "Classico"},
@@ -105,26 +340,23 @@ def run_correctness_tests():
                 print(
                     f"  - {algo_name:<12}: Lunghezza trovata = {actual_len}, Attesa = {expected_len}, "
                     f"Valida = {is_valid_subsequence} -> {status}")
-                results.append(
-                    {"TestScenario": "Correttezza", "Algorithm": algo_name, "TestCase": case_name, "Status": status})
+                yield Result("Correttezza", algo_name, test_case=case_name, status=status)
             except Exception as e:
                 print(f"  - {algo_name:<12}: ERRORE -> {e}")
-                results.append(
-                    {"TestScenario": "Correttezza", "Algorithm": algo_name, "TestCase": case_name, "Status": "Error"})
+                yield Result("Correttezza", algo_name, test_case=case_name, status="Error")
     print("\n--- Fine Test di Correttezza ---")
-    return results
 
 
 def run_comparison_performance_tests():
     """
     Esegue test di performance per confrontare gli algoritmi tra loro.
     Gli scenari sono separati in base alla complessità attesa: esponenziale (Forza Bruta, Ricorsivo)
-    e polinomiale (Memoized, Bottom-up), usando stringhe di dimensioni appropriate per ciascun gruppo.
+    e polinomiale (Memoized, Bottom-up, Hirschberg, Bit-parallel), usando stringhe di dimensioni appropriate
+    per ciascun gruppo.
     Per ogni combinazione di algoritmo e lunghezza, l'esperimento viene ripetuto più volte (num_repetitions)
-    e i risultati vengono aggregati calcolando la mediana, per ridurre l'impatto di eventuali outlier.
+    e i tempi vengono aggregati calcolando la mediana, per ridurre l'impatto di eventuali outlier.
     """
     print("\n--- Inizio Test di Performance di Confronto ---")
-    results = []
     # separo i test in piu scenari a seconda del tipo di algoritmo
     test_configs = [
         {
@@ -136,29 +368,53 @@ def run_comparison_performance_tests():
         },
         {
             "scenario_name": "Performance Confronto - Polinomiale",
-            "algorithms_to_run": ["Memoized", "Bottom-up"],
+            "algorithms_to_run": ["Memoized", "Bottom-up", "Hirschberg", "Bit-parallel"],
             "string_lengths": [0, 50, 100, 150, 200, 250, 300, 350, 400],
             "num_repetitions": 3,
             "alphabet": string.ascii_lowercase,
         },
     ]
-    for config in test_configs:
-        scenario = config["scenario_name"]
-        print(f"\nEsecuzione scenario: {scenario}")
-        for algo_name in config["algorithms_to_run"]:
-            for length in config["string_lengths"]:
-                times, memories = [], []
+    # per ogni scenario: coppie di stringhe, tempi e stati misurati, usati poi per la memoria
+    timed_scenarios = []
+    # i tempi vengono misurati in parallelo su tutti i core, un processo per esperimento, saltando le celle
+    # che supererebbero BUDGET_SECONDS; la memoria viene misurata solo dopo aver chiuso il pool, così il
+    # tracciamento non è mai attivo nei processi che misurano i tempi
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_warm_up_algorithms) as pool:
+        for config in test_configs:
+            scenario = config["scenario_name"]
+            alphabet_bytes = config["alphabet"].encode('ascii')
+            num_repetitions = config["num_repetitions"]
+            print(f"\nMisura dei tempi dello scenario: {scenario}")
+
+            # le coppie di stringhe di ogni (lunghezza, ripetizione) vengono generate una sola volta,
+            # prima e fuori da qualsiasi misura
+            pairs = {length: [_experiment_strings(scenario, length, alphabet_bytes, rep_idx)
+                              for rep_idx in range(num_repetitions)]
+                     for length in config["string_lengths"]}
+
+            # una serie per algoritmo: ogni coppia è condivisa da tutti gli algoritmi della stessa lunghezza
+            cells = {length: {(algo_name,): pairs[length] for algo_name in config["algorithms_to_run"]}
+                     for length in config["string_lengths"]}
+            times, statuses = _run_timed_within_budget(pool, config["string_lengths"], cells)
+            timed_scenarios.append((config, pairs, times, statuses))
+
+    # la memoria invece viene misurata in sequenza, perché processi concorrenti ne falserebbero il picco,
+    # e una sola volta (sulla prima ripetizione), dato che non dipende dal rumore sui tempi
+    # il tracciamento della memoria resta attivo per tutta questa fase e viene fermato alla sua fine
+    with _memory_tracing():
+        for config, pairs, times, statuses in timed_scenarios:
+            scenario = config["scenario_name"]
+            print(f"\nEsecuzione scenario: {scenario}")
+            for length, algo_name in product(config["string_lengths"], config["algorithms_to_run"]):
+                if (algo_name, length) not in times:
+                    yield Result(scenario, algo_name, length=length, status="Skipped")
+                    continue
                 print(f" - Test di {algo_name} con lunghezza {length}")
-                for i in range(config["num_repetitions"]):
-                    X = generate_random_string(length, config["alphabet"])
-                    Y = generate_random_string(length, config["alphabet"])
-                    _, exec_time, peak_mem = run_single_experiment(ALGORITHMS[algo_name], X, Y)
-                    times.append(exec_time)
-                    memories.append(peak_mem)
-                results.append({"TestScenario": scenario, "Algorithm": algo_name, "StringLength": length,
-                                "MedianTime_s": statistics.median(times), "PeakMemory_MB": statistics.median(memories)})
+                X, Y = pairs[length][0]
+                _, peak_mem = _run_memory(ALGORITHMS[algo_name], X, Y)
+                yield Result(scenario, algo_name, length=length, status=statuses[(algo_name, length)],
+                             median_time_s=_median(times[(algo_name, length)]) / 10 ** 9, peak_mem_mb=peak_mem)
     print("\n--- Fine Test di Performance di Confronto ---")
-    return results
 
 
 def run_alphabet_impact_tests():
@@ -169,31 +425,52 @@ def run_alphabet_impact_tests():
     il tempo e la memoria utilizzati.
     """
     print("\n--- Inizio Test Impatto Alfabeto ---")
-    results = []
     alphabets = {"DNA (4)": "ACTG", "A-Z (26)": string.ascii_uppercase}
+    # gli alfabeti vengono codificati in byte una sola volta, per tutte le coppie di stringhe
+    alphabets_bytes = {alphabet_name: alphabet.encode('ascii') for alphabet_name, alphabet in alphabets.items()}
     configs = [
         {"algorithms": ["Forza Bruta", "Ricorsivo"], "lengths": [10, 11, 12]},
-        {"algorithms": ["Memoized", "Bottom-up"], "lengths": [100, 200, 300]}
+        {"algorithms": ["Memoized", "Bottom-up", "Hirschberg", "Bit-parallel"], "lengths": [100, 200, 300]}
     ]
     num_repetitions = 5
-    for config in configs:
-        for algo_name in config["algorithms"]:
-            print(f"Test algoritmo: {algo_name}")
-            for length in config["lengths"]:
-                for alphabet_name, alphabet in alphabets.items():
-                    times, memories = [], []
-                    print(f"  - lunghezza: {length}, alfabeto: {alphabet_name}")
-                    for _ in range(num_repetitions):
-                        X = generate_random_string(length, alphabet)
-                        Y = generate_random_string(length, alphabet)
-                        _, exec_time, peak_mem = run_single_experiment(ALGORITHMS[algo_name], X, Y)
-                        times.append(exec_time)
-                        memories.append(peak_mem)
-                    results.append({"TestScenario": "Impatto Alfabeto", "Algorithm": algo_name, "StringLength": length,
-                                    "MedianTime_s": statistics.median(times),
-                                    "PeakMemory_MB": statistics.median(memories), "Alphabet": alphabet_name})
+    # come nei test di confronto, i tempi vengono misurati in parallelo e la memoria in sequenza,
+    # a pool chiuso; per ogni configurazione si conservano coppie di stringhe, tempi e stati
+    timed_configs = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_warm_up_algorithms) as pool:
+        for config in configs:
+            # genera tutte le coppie di stringhe prima di iniziare le misure;
+            # le stesse coppie vengono usate per tutti gli algoritmi, così il confronto non risente
+            # delle differenze tra stringhe casuali diverse
+            pairs = {(length, alphabet_name): [_experiment_strings(f"Impatto Alfabeto - {alphabet_name}",
+                                                                   length, alphabet_bytes, rep_idx)
+                                               for rep_idx in range(num_repetitions)]
+                     for length, (alphabet_name, alphabet_bytes) in product(config["lengths"],
+                                                                             alphabets_bytes.items())}
+
+            # una serie per ogni (algoritmo, alfabeto), con il budget stimato separatamente
+            cells = {length: {(algo_name, alphabet_name): pairs[(length, alphabet_name)]
+                              for alphabet_name, algo_name in product(alphabets, config["algorithms"])}
+                     for length in config["lengths"]}
+            times, statuses = _run_timed_within_budget(pool, config["lengths"], cells)
+            timed_configs.append((config, pairs, times, statuses))
+
+    with _memory_tracing():
+        for config, pairs, times, statuses in timed_configs:
+            for (length, alphabet_name), cell_pairs in pairs.items():
+                print(f"Test con lunghezza: {length}, alfabeto: {alphabet_name}")
+                for algo_name in config["algorithms"]:
+                    if (algo_name, alphabet_name, length) not in times:
+                        yield Result("Impatto Alfabeto", algo_name, length=length, status="Skipped",
+                                     alphabet=alphabet_name)
+                        continue
+                    print(f"  - algoritmo: {algo_name}")
+                    # la memoria viene misurata una sola volta, sulla prima coppia
+                    _, peak_mem = _run_memory(ALGORITHMS[algo_name], *cell_pairs[0])
+                    yield Result("Impatto Alfabeto", algo_name, length=length,
+                                 status=statuses[(algo_name, alphabet_name, length)],
+                                 median_time_s=_median(times[(algo_name, alphabet_name, length)]) / 10 ** 9,
+                                 peak_mem_mb=peak_mem, alphabet=alphabet_name)
     print("\n--- Fine Test Impatto Alfabeto ---")
-    return results
 
 
 def main():
@@ -201,31 +478,24 @@ def main():
     Funzione principale che fa partire tutte le suite di test.
     I risultati vengono salvati su un singolo file csv.
     """
-    all_results = (
-            run_correctness_tests() +
-            run_comparison_performance_tests() +
-            run_alphabet_impact_tests()
-    )
+    _warm_up_algorithms()
+
     output_csv_file = 'test_suite_results.csv'
-    if not all_results:
-        print("Nessun risultato da salvare")
-        return
-
-    # trovo tutti i possibili campi dai vari risultati, assegnando loro una colonna del file
-    all_fieldnames = set().union(*(d.keys() for d in all_results))
-    preferred_order = [
-        "TestScenario", "Algorithm", "TestCase", "StringLength", "Status",
-        "MedianTime_s", "PeakMemory_MB", "Alphabet", "ExpectedLCS_Length",
-        "ActualLCS_Length", "String1", "String2", "ErrorDetails"
-    ]
-    fieldnames = [field for field in preferred_order if field in all_fieldnames]
-    fieldnames += sorted([field for field in all_fieldnames if field not in preferred_order])
 
     try:
         with open(output_csv_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, restval='N/A')
+            # le colonne sono fisse e note a priori (i campi di Result), quindi l'intestazione si scrive subito;
+            # una colonna fuori schema sarebbe un errore nel codice e fa fallire la scrittura invece di sparire
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES, restval='N/A')
             writer.writeheader()
-            writer.writerows(all_results)
+            csvfile.flush()
+            # le suite sono generatori: ogni riga viene scritta appena prodotta, senza liste intermedie né
+            # concatenazioni, e se l'esecuzione si interrompe quelle già ottenute restano sul file
+            # (ogni Result viene convertito in dizionario solo al momento di scriverlo);
+            # al termine di ogni suite i risultati vengono scaricati su disco
+            for run_suite in (run_correctness_tests, run_comparison_performance_tests, run_alphabet_impact_tests):
+                writer.writerows(result.to_row() for result in run_suite())
+                csvfile.flush()
         print(f"\nEsperimenti conclusi. Risultati salvati in {os.path.abspath(output_csv_file)}")
     except IOError as e:
         print(f"\nErrore durante la scrittura del file CSV: {e}")